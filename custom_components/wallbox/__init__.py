@@ -1,244 +1,127 @@
 """The Wallbox integration."""
 from __future__ import annotations
 
-from datetime import timedelta
-from http import HTTPStatus
+import importlib
 import logging
-from typing import Any
-
-import requests
-from wallbox import Wallbox
+from time import perf_counter
+from types import ModuleType
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
-
-from homeassistant.helpers.entity import DeviceInfo
-from .const import (
-    CONF_CURRENT_VERSION_KEY,
-    CONF_DATA_KEY,
-    CONF_LOCKED_UNLOCKED_KEY,
-    CONF_MAX_CHARGING_CURRENT_KEY,
-    CONF_NAME_KEY,
-    CONF_PART_NUMBER_KEY,
-    CONF_SERIAL_NUMBER_KEY,
-    CONF_SOFTWARE_KEY,
-    CONF_STATION,
-    CONF_STATUS_DESCRIPTION_KEY,
-    CONF_STATUS_ID_KEY,
-    DOMAIN,
-)
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import CONF_EXPORT_TARGET, CONF_STATION, DOMAIN
+from .exporter import WallboxExporter
+from .session import WallboxSessionTracker
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR, Platform.NUMBER, Platform.LOCK, Platform.SWITCH]
-UPDATE_INTERVAL = 30
-
-# Translation of StatusId based on Wallbox portal code:
-# https://my.wallbox.com/src/utilities/charger/chargerStatuses.js
-CHARGER_STATUS: dict[int, str] = {
-    0: "Disconnected",
-    14: "Error",
-    15: "Error",
-    161: "Ready",
-    162: "Ready",
-    163: "Disconnected",
-    164: "Waiting",
-    165: "Locked",
-    166: "Updating",
-    177: "Scheduled",
-    178: "Paused",
-    179: "Scheduled",
-    180: "Waiting for car demand",
-    181: "Waiting for car demand",
-    182: "Paused",
-    183: "Waiting in queue by Power Sharing",
-    184: "Waiting in queue by Power Sharing",
-    185: "Waiting in queue by Power Boost",
-    186: "Waiting in queue by Power Boost",
-    187: "Waiting MID failed",
-    188: "Waiting MID safety margin exceeded",
-    189: "Waiting in queue by Eco-Smart",
-    193: "Charging",
-    194: "Charging",
-    195: "Charging",
-    196: "Discharging",
-    209: "Locked",
-    210: "Locked",
-}
-
-
-class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Wallbox Coordinator class."""
-
-    def __init__(self, station: str, wallbox: Wallbox, hass: HomeAssistant) -> None:
-        """Initialize."""
-        self._station = station
-        self._wallbox = wallbox
-
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
-        )
 
-    def _authenticate(self) -> None:
-        """Authenticate using Wallbox API."""
-        try:
-            self._wallbox.authenticate()
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            if wallbox_connection_error.response.status_code == HTTPStatus.FORBIDDEN:
-                raise ConfigEntryAuthFailed from wallbox_connection_error
-            raise ConnectionError from wallbox_connection_error
-
-    def _validate(self) -> None:
-        """Authenticate using Wallbox API."""
-        try:
-            self._wallbox.authenticate()
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            if wallbox_connection_error.response.status_code == 403:
-                raise InvalidAuth from wallbox_connection_error
-            raise ConnectionError from wallbox_connection_error
-
-    async def async_validate_input(self) -> None:
-        """Get new sensor data for Wallbox component."""
-        await self.hass.async_add_executor_job(self._validate)
-
-    def _get_data(self) -> dict[str, Any]:
-        """Get new sensor data for Wallbox component."""
-        try:
-            self._authenticate()
-            data: dict[str, Any] = self._wallbox.getChargerStatus(self._station)
-            data[CONF_MAX_CHARGING_CURRENT_KEY] = data[CONF_DATA_KEY][
-                CONF_MAX_CHARGING_CURRENT_KEY
-            ]
-            data[CONF_LOCKED_UNLOCKED_KEY] = data[CONF_DATA_KEY][
-                CONF_LOCKED_UNLOCKED_KEY
-            ]
-            data[CONF_STATUS_DESCRIPTION_KEY] = CHARGER_STATUS.get(
-                data[CONF_STATUS_ID_KEY], "Unknown"
-            )
 
-            return data
-
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            raise ConnectionError from wallbox_connection_error
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Get new sensor data for Wallbox component."""
-        return await self.hass.async_add_executor_job(self._get_data)
-
-    def _set_charging_current(self, charging_current: float) -> None:
-        """Set maximum charging current for Wallbox."""
-        try:
-            self._authenticate()
-            self._wallbox.setMaxChargingCurrent(self._station, charging_current)
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            if wallbox_connection_error.response.status_code == 403:
-                raise InvalidAuth from wallbox_connection_error
-            raise ConnectionError from wallbox_connection_error
-
-    async def async_set_charging_current(self, charging_current: float) -> None:
-        """Set maximum charging current for Wallbox."""
-        await self.hass.async_add_executor_job(
-            self._set_charging_current, charging_current
-        )
-        await self.async_request_refresh()
-
-    def _set_lock_unlock(self, lock: bool) -> None:
-        """Set wallbox to locked or unlocked."""
-        try:
-            self._authenticate()
-            if lock:
-                self._wallbox.lockCharger(self._station)
-            else:
-                self._wallbox.unlockCharger(self._station)
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            if wallbox_connection_error.response.status_code == 403:
-                raise InvalidAuth from wallbox_connection_error
-            raise ConnectionError from wallbox_connection_error
-
-    async def async_set_lock_unlock(self, lock: bool) -> None:
-        """Set wallbox to locked or unlocked."""
-        await self.hass.async_add_executor_job(self._set_lock_unlock, lock)
-        await self.async_request_refresh()
-
-    def _pause_charger(self, pause: bool) -> None:
-        """Set wallbox to pause or resume."""
-        try:
-            self._authenticate()
-            if pause:
-                self._wallbox.pauseChargingSession(self._station)
-            else:
-                self._wallbox.resumeChargingSession(self._station)
-        except requests.exceptions.HTTPError as wallbox_connection_error:
-            if wallbox_connection_error.response.status_code == 403:
-                raise InvalidAuth from wallbox_connection_error
-            raise ConnectionError from wallbox_connection_error
-
-    async def async_pause_charger(self, pause: bool) -> None:
-        """Set wallbox to pause or resume."""
-        await self.hass.async_add_executor_job(self._pause_charger, pause)
-        await self.async_request_refresh()
+async def async_import_coordinator(hass: HomeAssistant) -> ModuleType:
+    """Import the coordinator module off the event loop.
+
+    The coordinator pulls in requests and the wallbox client, so it is only
+    imported once an entry is set up or a config flow validates input.
+    """
+    return await hass.async_add_executor_job(
+        importlib.import_module, f"{__name__}.coordinator"
+    )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Wallbox from a config entry."""
-    wallbox = Wallbox(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
-    wallbox_coordinator = WallboxCoordinator(
+    start = perf_counter()
+    coordinator_module = await async_import_coordinator(hass)
+    imported = perf_counter()
+
+    wallbox = coordinator_module.Wallbox(
+        entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD]
+    )
+    wallbox_coordinator = coordinator_module.WallboxCoordinator(
         entry.data[CONF_STATION],
         wallbox,
         hass,
     )
 
-    try:
-        await wallbox_coordinator.async_validate_input()
-
-    except InvalidAuth as ex:
-        raise ConfigEntryAuthFailed from ex
-
+    # The first refresh authenticates and raises ConfigEntryAuthFailed on a
+    # rejected login, so no separate validation round-trip is needed here.
     await wallbox_coordinator.async_config_entry_first_refresh()
+    refreshed = perf_counter()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = wallbox_coordinator
+    session_tracker = WallboxSessionTracker(hass, entry.data[CONF_STATION])
+    entry.async_on_unload(
+        wallbox_coordinator.async_add_listener(
+            lambda: session_tracker.async_handle_update(wallbox_coordinator.data)
+        )
+    )
+    session_tracker.async_handle_update(wallbox_coordinator.data)
+
+    if export_target := entry.options.get(CONF_EXPORT_TARGET):
+        exporter = WallboxExporter(hass, entry.data[CONF_STATION], export_target)
+        exporter.async_start()
+        entry.async_on_unload(
+            wallbox_coordinator.async_add_listener(
+                lambda: exporter.async_handle_update(wallbox_coordinator.data)
+            )
+        )
+        wallbox_coordinator.exporter = exporter
+        exporter.async_handle_update(wallbox_coordinator.data)
 
-    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = wallbox_coordinator
+    wallbox_coordinator.setup_options = dict(entry.options)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Forward all platforms concurrently and wait for them, so the setup time
+    # also covers platform and entity setup.
+    forwarding = perf_counter()
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    forwarded = perf_counter()
+
+    wallbox_coordinator.setup_timings = {
+        "import": imported - start,
+        "first_refresh": refreshed - imported,
+        "platforms": forwarded - forwarding,
+        "setup": forwarded - start,
+    }
+    _LOGGER.debug(
+        "Setup of %s took %.3fs (import %.3fs, first refresh %.3fs, platforms %.3fs)",
+        entry.data[CONF_STATION],
+        wallbox_coordinator.setup_timings["setup"],
+        wallbox_coordinator.setup_timings["import"],
+        wallbox_coordinator.setup_timings["first_refresh"],
+        wallbox_coordinator.setup_timings["platforms"],
+    )
 
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change.
+
+    Update listeners also fire for data updates, such as reauth, which
+    already reloads the entry from the config flow.
+    """
+    wallbox_coordinator = hass.data[DOMAIN][entry.entry_id]
+    if entry.options != wallbox_coordinator.setup_options:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        wallbox_coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await wallbox_coordinator.async_shutdown()
+        # Awaited here rather than in async_on_unload, so a reload never starts
+        # a new exporter on the same target while this one is still flushing.
+        if wallbox_coordinator.exporter is not None:
+            await wallbox_coordinator.exporter.async_stop()
 
     return unload_ok
 
 
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
-
-
-class WallboxEntity(CoordinatorEntity[WallboxCoordinator]):
-    """Defines a base Wallbox entity."""
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this Wallbox device."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self.coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY])
-            },
-            name=f"Wallbox - {self.coordinator.data[CONF_NAME_KEY]}",
-            manufacturer="Wallbox",
-            model=self.coordinator.data[CONF_DATA_KEY][CONF_PART_NUMBER_KEY],
-            sw_version=self.coordinator.data[CONF_DATA_KEY][CONF_SOFTWARE_KEY][
-                CONF_CURRENT_VERSION_KEY
-            ],
-        )
@@ -4,14 +4,25 @@ from __future__ import annotations
 from typing import Any
 
 import voluptuous as vol
-from wallbox import Wallbox
 
 from homeassistant import config_entries, core
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from . import InvalidAuth, WallboxCoordinator
-from .const import CONF_STATION, DOMAIN
+from . import InvalidAuth, async_import_coordinator
+from .const import (
+    CONF_DEADBAND,
+    CONF_EXPORT_TARGET,
+    CONF_HEARTBEAT,
+    CONF_MIN_INTERVAL,
+    CONF_SAMPLING,
+    CONF_SENSOR,
+    CONF_STATION,
+    DOMAIN,
+    SENSOR_NAMES,
+)
+from .exporter import export_target_is_valid, resolve_export_target
 
 COMPONENT_DOMAIN = DOMAIN
 
@@ -31,8 +42,11 @@ async def validate_input(
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    wallbox = Wallbox(data["username"], data["password"])
-    wallbox_coordinator = WallboxCoordinator(data["station"], wallbox, hass)
+    coordinator_module = await async_import_coordinator(hass)
+    wallbox = coordinator_module.Wallbox(data["username"], data["password"])
+    wallbox_coordinator = coordinator_module.WallboxCoordinator(
+        data["station"], wallbox, hass
+    )
 
     await wallbox_coordinator.async_validate_input()
 
@@ -47,6 +61,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=COMPONENT_DOMAIN):
         """Start the Wallbox config flow."""
         self._reauth_entry: config_entries.ConfigEntry | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_reauth(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -94,3 +116,85 @@ class ConfigFlow(config_entries.ConfigFlow, domain=COMPONENT_DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Wallbox options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the Wallbox options flow."""
+        self.config_entry = config_entry
+        self._options: dict[str, Any] = dict(config_entry.options)
+        self._sensor: str | None = None
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the Wallbox options."""
+        errors = {}
+
+        if user_input is not None:
+            export_target = user_input[CONF_EXPORT_TARGET]
+            if export_target and not await self.hass.async_add_executor_job(
+                export_target_is_valid,
+                resolve_export_target(self.hass, export_target),
+            ):
+                errors[CONF_EXPORT_TARGET] = "invalid_export_target"
+            else:
+                self._options[CONF_EXPORT_TARGET] = export_target
+                self._sensor = user_input.get(CONF_SENSOR) or None
+                if self._sensor:
+                    return await self.async_step_sampling()
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_EXPORT_TARGET,
+                        default=self._options.get(CONF_EXPORT_TARGET, ""),
+                    ): str,
+                    vol.Optional(CONF_SENSOR, default=""): vol.In(
+                        {
+                            "": "-",
+                            **SENSOR_NAMES,
+                        }
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_sampling(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Set the update policy of a single sensor."""
+        assert self._sensor is not None
+        sampling: dict[str, dict[str, Any]] = dict(
+            self._options.get(CONF_SAMPLING, {})
+        )
+
+        if user_input is not None:
+            sampling[self._sensor] = user_input
+            self._options[CONF_SAMPLING] = sampling
+            return self.async_create_entry(title="", data=self._options)
+
+        policy = sampling.get(self._sensor, {})
+        return self.async_show_form(
+            step_id="sampling",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_MIN_INTERVAL, default=policy.get(CONF_MIN_INTERVAL, 0)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DEADBAND, default=policy.get(CONF_DEADBAND, 0.0)
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_HEARTBEAT, default=policy.get(CONF_HEARTBEAT, 0)
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                }
+            ),
+            description_placeholders={"sensor": self._sensor},
+        )
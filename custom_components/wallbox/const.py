@@ -2,7 +2,16 @@
 
 DOMAIN = "wallbox"
 
+EVENT_SESSION_STARTED = "wallbox_session_started"
+EVENT_SESSION_ENDED = "wallbox_session_ended"
+
 CONF_STATION = "station"
+CONF_EXPORT_TARGET = "export_target"
+CONF_SAMPLING = "sampling"
+CONF_SENSOR = "sensor"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_DEADBAND = "deadband"
+CONF_HEARTBEAT = "heartbeat"
 CONF_ADDED_ENERGY_KEY = "added_energy"
 CONF_ADDED_RANGE_KEY = "added_range"
 CONF_CHARGING_POWER_KEY = "charging_power"
@@ -25,3 +34,20 @@ CONF_STATE_OF_CHARGE_KEY = "state_of_charge"
 CONF_STATUS_ID_KEY = "status_id"
 CONF_STATUS_DESCRIPTION_KEY = "status_description"
 CONF_CONNECTIONS = "connections"
+
+
+# Sensors that can be given an update policy in the options flow, with their
+# names; sensor.py names its entities from this mapping.
+SENSOR_NAMES: dict[str, str] = {
+    CONF_CHARGING_POWER_KEY: "Charging Power",
+    CONF_MAX_AVAILABLE_POWER_KEY: "Max Available Power",
+    CONF_CHARGING_SPEED_KEY: "Charging Speed",
+    CONF_ADDED_RANGE_KEY: "Added Range",
+    CONF_ADDED_ENERGY_KEY: "Added Energy",
+    CONF_COST_KEY: "Cost",
+    CONF_STATE_OF_CHARGE_KEY: "State of Charge",
+    CONF_CURRENT_MODE_KEY: "Current Mode",
+    CONF_DEPOT_PRICE_KEY: "Depot Price",
+    CONF_STATUS_DESCRIPTION_KEY: "Status Description",
+    CONF_MAX_CHARGING_CURRENT_KEY: "Max. Charging Current",
+}
@@ -0,0 +1,251 @@
+"""Data update coordinator for the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+from http import HTTPStatus
+import logging
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import requests
+from wallbox import Wallbox
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from . import InvalidAuth
+from .const import (
+    CONF_DATA_KEY,
+    CONF_LOCKED_UNLOCKED_KEY,
+    CONF_MAX_CHARGING_CURRENT_KEY,
+    CONF_STATUS_DESCRIPTION_KEY,
+    CONF_STATUS_ID_KEY,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from .exporter import WallboxExporter
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = 30
+SHUTDOWN_TIMEOUT = 10
+
+_T = TypeVar("_T")
+
+# Translation of StatusId based on Wallbox portal code:
+# https://my.wallbox.com/src/utilities/charger/chargerStatuses.js
+CHARGER_STATUS: dict[int, str] = {
+    0: "Disconnected",
+    14: "Error",
+    15: "Error",
+    161: "Ready",
+    162: "Ready",
+    163: "Disconnected",
+    164: "Waiting",
+    165: "Locked",
+    166: "Updating",
+    177: "Scheduled",
+    178: "Paused",
+    179: "Scheduled",
+    180: "Waiting for car demand",
+    181: "Waiting for car demand",
+    182: "Paused",
+    183: "Waiting in queue by Power Sharing",
+    184: "Waiting in queue by Power Sharing",
+    185: "Waiting in queue by Power Boost",
+    186: "Waiting in queue by Power Boost",
+    187: "Waiting MID failed",
+    188: "Waiting MID safety margin exceeded",
+    189: "Waiting in queue by Eco-Smart",
+    193: "Charging",
+    194: "Charging",
+    195: "Charging",
+    196: "Discharging",
+    209: "Locked",
+    210: "Locked",
+}
+
+
+class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Wallbox Coordinator class."""
+
+    def __init__(self, station: str, wallbox: Wallbox, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._station = station
+        self._wallbox = wallbox
+        self.setup_timings: dict[str, float] = {}
+        self.setup_options: dict[str, Any] = {}
+        self.exporter: WallboxExporter | None = None
+        # Only one API call per station may be in flight; polls and commands
+        # queue on this lock in the order they were issued.
+        self._api_lock = asyncio.Lock()
+        self._fetch_task: asyncio.Task[dict[str, Any]] | None = None
+        self._shutdown_requested = False
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+        )
+
+    def _authenticate(self) -> None:
+        """Authenticate using Wallbox API."""
+        try:
+            self._wallbox.authenticate()
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            if wallbox_connection_error.response.status_code == HTTPStatus.FORBIDDEN:
+                raise ConfigEntryAuthFailed from wallbox_connection_error
+            raise ConnectionError from wallbox_connection_error
+
+    def _validate(self) -> None:
+        """Authenticate using Wallbox API."""
+        try:
+            self._wallbox.authenticate()
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            if wallbox_connection_error.response.status_code == 403:
+                raise InvalidAuth from wallbox_connection_error
+            raise ConnectionError from wallbox_connection_error
+
+    async def _async_run_locked(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking Wallbox API call while holding the station lock."""
+        async with self._api_lock:
+            return await self.hass.async_add_executor_job(func, *args)
+
+    async def _async_run(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Queue a blocking Wallbox API call behind any call already in flight.
+
+        The call runs in its own task so a cancelled caller cannot release the
+        lock while the executor job is still talking to the API.
+        """
+        return await asyncio.shield(
+            self.hass.async_create_task(self._async_run_locked(func, *args))
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and wait for the API calls still queued or in flight.
+
+        Called on unload so a reloaded entry does not overlap its calls with
+        the ones still running for the previous coordinator of the same
+        station. The wait is bounded so a hung cloud call cannot block unload.
+        """
+        self._shutdown_requested = True
+        self._unschedule_refresh()
+        self._debounced_refresh.async_cancel()
+        try:
+            await asyncio.wait_for(self._async_wait_idle(), SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Wallbox API call for %s still running after %s seconds",
+                self._station,
+                SHUTDOWN_TIMEOUT,
+            )
+
+    async def _async_wait_idle(self) -> None:
+        """Wait until no fetch or command is pending for this station."""
+        if self._fetch_task is not None:
+            await asyncio.wait([self._fetch_task])
+        async with self._api_lock:
+            pass
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll unless the coordinator is shutting down."""
+        if self._shutdown_requested:
+            return
+        super()._schedule_refresh()
+
+    async def async_validate_input(self) -> None:
+        """Get new sensor data for Wallbox component."""
+        await self._async_run(self._validate)
+
+    def _get_data(self) -> dict[str, Any]:
+        """Get new sensor data for Wallbox component."""
+        try:
+            self._authenticate()
+            data: dict[str, Any] = self._wallbox.getChargerStatus(self._station)
+            data[CONF_MAX_CHARGING_CURRENT_KEY] = data[CONF_DATA_KEY][
+                CONF_MAX_CHARGING_CURRENT_KEY
+            ]
+            data[CONF_LOCKED_UNLOCKED_KEY] = data[CONF_DATA_KEY][
+                CONF_LOCKED_UNLOCKED_KEY
+            ]
+            data[CONF_STATUS_DESCRIPTION_KEY] = CHARGER_STATUS.get(
+                data[CONF_STATUS_ID_KEY], "Unknown"
+            )
+
+            return data
+
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            raise ConnectionError from wallbox_connection_error
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Get new sensor data for Wallbox component.
+
+        A refresh requested while a fetch is still pending joins that fetch
+        instead of queueing another one. Commands hold the same lock, so a
+        pending fetch never predates a command that has already completed and
+        its result is never older than the state the command produced.
+        """
+        if self._shutdown_requested:
+            # A refresh requested by a command finishing during unload.
+            return self.data
+        if self._fetch_task is None or self._fetch_task.done():
+            self._fetch_task = self.hass.async_create_task(
+                self._async_run_locked(self._get_data)
+            )
+        return await asyncio.shield(self._fetch_task)
+
+    def _set_charging_current(self, charging_current: float) -> None:
+        """Set maximum charging current for Wallbox."""
+        try:
+            self._authenticate()
+            self._wallbox.setMaxChargingCurrent(self._station, charging_current)
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            if wallbox_connection_error.response.status_code == 403:
+                raise InvalidAuth from wallbox_connection_error
+            raise ConnectionError from wallbox_connection_error
+
+    async def async_set_charging_current(self, charging_current: float) -> None:
+        """Set maximum charging current for Wallbox."""
+        await self._async_run(self._set_charging_current, charging_current)
+        await self.async_request_refresh()
+
+    def _set_lock_unlock(self, lock: bool) -> None:
+        """Set wallbox to locked or unlocked."""
+        try:
+            self._authenticate()
+            if lock:
+                self._wallbox.lockCharger(self._station)
+            else:
+                self._wallbox.unlockCharger(self._station)
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            if wallbox_connection_error.response.status_code == 403:
+                raise InvalidAuth from wallbox_connection_error
+            raise ConnectionError from wallbox_connection_error
+
+    async def async_set_lock_unlock(self, lock: bool) -> None:
+        """Set wallbox to locked or unlocked."""
+        await self._async_run(self._set_lock_unlock, lock)
+        await self.async_request_refresh()
+
+    def _pause_charger(self, pause: bool) -> None:
+        """Set wallbox to pause or resume."""
+        try:
+            self._authenticate()
+            if pause:
+                self._wallbox.pauseChargingSession(self._station)
+            else:
+                self._wallbox.resumeChargingSession(self._station)
+        except requests.exceptions.HTTPError as wallbox_connection_error:
+            if wallbox_connection_error.response.status_code == 403:
+                raise InvalidAuth from wallbox_connection_error
+            raise ConnectionError from wallbox_connection_error
+
+    async def async_pause_charger(self, pause: bool) -> None:
+        """Set wallbox to pause or resume."""
+        await self._async_run(self._pause_charger, pause)
+        await self.async_request_refresh()
@@ -0,0 +1,23 @@
+"""Diagnostics support for the Wallbox integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import WallboxCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry, including setup timings."""
+    coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "setup_timings": coordinator.setup_timings,
+    }
@@ -0,0 +1,186 @@
+"""Telemetry exporter for the Wallbox integration.
+
+Writes the fields that changed on each coordinator update as compact NDJSON
+lines to a rotating local file or a local unix socket, bypassing the state
+machine and recorder.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+import json
+import logging
+import os
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+EXPORT_SOCKET_PREFIX = "unix://"
+EXPORT_QUEUE_SIZE = 1000
+EXPORT_BATCH_SIZE = 100
+EXPORT_MAX_BYTES = 10 * 1024 * 1024
+EXPORT_BACKUP_COUNT = 3
+
+_MISSING = object()
+
+
+def resolve_export_target(hass: HomeAssistant, target: str) -> str:
+    """Return the target with relative paths resolved in the config directory."""
+    if target.startswith(EXPORT_SOCKET_PREFIX):
+        path = hass.config.path(target[len(EXPORT_SOCKET_PREFIX) :])
+        return f"{EXPORT_SOCKET_PREFIX}{path}"
+    return hass.config.path(target)
+
+
+def export_target_is_valid(target: str) -> bool:
+    """Return whether a resolved target can be written to."""
+    if target.startswith(EXPORT_SOCKET_PREFIX):
+        return os.path.isdir(os.path.dirname(target[len(EXPORT_SOCKET_PREFIX) :]))
+    directory = os.path.dirname(target)
+    return os.path.isdir(directory) and os.access(directory, os.W_OK)
+
+
+class WallboxExporter:
+    """Stream changed coordinator fields to a local file or unix socket."""
+
+    def __init__(self, hass: HomeAssistant, station: str, target: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._station = station
+        self._target = resolve_export_target(hass, target)
+        self._last: dict[str, Any] = {}
+        # Bounded so a slow or absent consumer cannot grow memory; records
+        # that do not fit are dropped and counted.
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._writer_task: asyncio.Task[None] | None = None
+        self._write_task: asyncio.Task[None] | None = None
+        self._stream: asyncio.StreamWriter | None = None
+        self._failing = False
+        self.dropped = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start the background writer."""
+        # Not tracked by hass, as it runs until the entry is unloaded and would
+        # otherwise hold up async_block_till_done.
+        self._writer_task = self._hass.loop.create_task(self._async_write_loop())
+
+    async def async_stop(self) -> None:
+        """Stop the background writer and flush the records still queued."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+        # A write the writer was waiting on keeps running after the cancel;
+        # let it finish so two writes never touch the target at once.
+        if self._write_task is not None:
+            await self._write_task
+            self._write_task = None
+        while batch := self._drain(EXPORT_BATCH_SIZE):
+            await self._async_write(batch)
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    @callback
+    def async_handle_update(self, data: dict[str, Any] | None) -> None:
+        """Queue a record with the scalar fields that changed since the last one."""
+        if not data:
+            return
+        changed = {
+            key: value
+            for key, value in data.items()
+            if (value is None or isinstance(value, (str, int, float, bool)))
+            and self._last.get(key, _MISSING) != value
+        }
+        if not changed:
+            return
+        self._last.update(changed)
+        record = {"ts": round(time(), 3), "station": self._station, **changed}
+        try:
+            self._queue.put_nowait(json.dumps(record, separators=(",", ":")))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % EXPORT_QUEUE_SIZE == 0:
+                _LOGGER.warning(
+                    "Wallbox exporter for %s is falling behind, %s records dropped",
+                    self._station,
+                    self.dropped,
+                )
+
+    def _drain(self, limit: int) -> list[str]:
+        """Take up to limit queued records without waiting."""
+        batch: list[str] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _async_write_loop(self) -> None:
+        """Write queued records in batches as they arrive."""
+        while True:
+            batch = [await self._queue.get()]
+            batch.extend(self._drain(EXPORT_BATCH_SIZE - 1))
+            self._write_task = self._hass.loop.create_task(self._async_write(batch))
+            # Shielded so cancelling the writer never abandons a write midway.
+            await asyncio.shield(self._write_task)
+            self._write_task = None
+
+    async def _async_write(self, batch: list[str]) -> None:
+        """Write a batch of records to the configured target."""
+        payload = "\n".join(batch) + "\n"
+        try:
+            if self._target.startswith(EXPORT_SOCKET_PREFIX):
+                await self._async_write_socket(payload)
+            else:
+                await self._hass.async_add_executor_job(self._write_file, payload)
+        except OSError as err:
+            self.dropped += len(batch)
+            # Warn once per outage so a bad target does not go unnoticed.
+            _LOGGER.log(
+                logging.DEBUG if self._failing else logging.WARNING,
+                "Wallbox exporter for %s cannot write to %s: %s",
+                self._station,
+                self._target,
+                err,
+            )
+            self._failing = True
+        else:
+            if self._failing:
+                _LOGGER.info("Wallbox exporter for %s recovered", self._station)
+            self._failing = False
+
+    async def _async_write_socket(self, payload: str) -> None:
+        """Write to the unix socket, waiting for the reader to keep up."""
+        if self._stream is None or self._stream.is_closing():
+            _, self._stream = await asyncio.open_unix_connection(
+                self._target[len(EXPORT_SOCKET_PREFIX) :]
+            )
+        self._stream.write(payload.encode())
+        try:
+            await self._stream.drain()
+        except OSError:
+            self._stream.close()
+            self._stream = None
+            raise
+
+    def _write_file(self, payload: str) -> None:
+        """Append to the export file, rotating it once it grows too large."""
+        try:
+            if os.path.getsize(self._target) >= EXPORT_MAX_BYTES:
+                self._rotate()
+        except FileNotFoundError:
+            pass
+        with open(self._target, "a", encoding="utf-8") as file:
+            file.write(payload)
+
+    def _rotate(self) -> None:
+        """Shift export.1 .. export.N and move the current file to export.1."""
+        for index in range(EXPORT_BACKUP_COUNT - 1, 0, -1):
+            source = f"{self._target}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._target}.{index + 1}")
+        os.replace(self._target, f"{self._target}.1")
@@ -8,13 +8,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import InvalidAuth, WallboxCoordinator, WallboxEntity
+from . import InvalidAuth
 from .const import (
     CONF_DATA_KEY,
     CONF_LOCKED_UNLOCKED_KEY,
     CONF_SERIAL_NUMBER_KEY,
     DOMAIN,
 )
+from .coordinator import WallboxCoordinator
+from .entity import WallboxEntity
 
 LOCK_TYPES: dict[str, LockEntityDescription] = {
     CONF_LOCKED_UNLOCKED_KEY: LockEntityDescription(
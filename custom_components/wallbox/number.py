@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import InvalidAuth, WallboxCoordinator, WallboxEntity
+from . import InvalidAuth
 from .const import (
     CONF_DATA_KEY,
     CONF_MAX_AVAILABLE_POWER_KEY,
@@ -17,6 +17,8 @@ from .const import (
     CONF_SERIAL_NUMBER_KEY,
     DOMAIN,
 )
+from .coordinator import WallboxCoordinator
+from .entity import WallboxEntity
 
 
 @dataclass
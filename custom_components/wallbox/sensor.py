@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from time import monotonic
 from typing import cast
 
 from homeassistant.components.sensor import (
@@ -19,11 +20,10 @@ from homeassistant.const import (
     PERCENTAGE,
     POWER_KILO_WATT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from . import WallboxCoordinator, WallboxEntity
 from .const import (
     CONF_ADDED_ENERGY_KEY,
     CONF_ADDED_RANGE_KEY,
@@ -32,14 +32,21 @@ from .const import (
     CONF_COST_KEY,
     CONF_CURRENT_MODE_KEY,
     CONF_DATA_KEY,
+    CONF_DEADBAND,
     CONF_DEPOT_PRICE_KEY,
+    CONF_HEARTBEAT,
     CONF_MAX_AVAILABLE_POWER_KEY,
     CONF_MAX_CHARGING_CURRENT_KEY,
+    CONF_MIN_INTERVAL,
+    CONF_SAMPLING,
     CONF_SERIAL_NUMBER_KEY,
     CONF_STATE_OF_CHARGE_KEY,
     CONF_STATUS_DESCRIPTION_KEY,
     DOMAIN,
+    SENSOR_NAMES,
 )
+from .coordinator import WallboxCoordinator
+from .entity import WallboxEntity
 
 CONF_STATION = "station"
 UPDATE_INTERVAL = 30
@@ -57,7 +64,7 @@ class WallboxSensorEntityDescription(SensorEntityDescription):
 SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     CONF_CHARGING_POWER_KEY: WallboxSensorEntityDescription(
         key=CONF_CHARGING_POWER_KEY,
-        name="Charging Power",
+        name=SENSOR_NAMES[CONF_CHARGING_POWER_KEY],
         precision=2,
         native_unit_of_measurement=POWER_KILO_WATT,
         device_class=SensorDeviceClass.POWER,
@@ -65,7 +72,7 @@ SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     ),
     CONF_MAX_AVAILABLE_POWER_KEY: WallboxSensorEntityDescription(
         key=CONF_MAX_AVAILABLE_POWER_KEY,
-        name="Max Available Power",
+        name=SENSOR_NAMES[CONF_MAX_AVAILABLE_POWER_KEY],
         precision=0,
         native_unit_of_measurement=ELECTRIC_CURRENT_AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -74,21 +81,21 @@ SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     CONF_CHARGING_SPEED_KEY: WallboxSensorEntityDescription(
         key=CONF_CHARGING_SPEED_KEY,
         icon="mdi:speedometer",
-        name="Charging Speed",
+        name=SENSOR_NAMES[CONF_CHARGING_SPEED_KEY],
         precision=0,
         state_class=SensorStateClass.MEASUREMENT,
     ),
     CONF_ADDED_RANGE_KEY: WallboxSensorEntityDescription(
         key=CONF_ADDED_RANGE_KEY,
         icon="mdi:map-marker-distance",
-        name="Added Range",
+        name=SENSOR_NAMES[CONF_ADDED_RANGE_KEY],
         precision=0,
         native_unit_of_measurement=LENGTH_KILOMETERS,
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
     CONF_ADDED_ENERGY_KEY: WallboxSensorEntityDescription(
         key=CONF_ADDED_ENERGY_KEY,
-        name="Added Energy",
+        name=SENSOR_NAMES[CONF_ADDED_ENERGY_KEY],
         precision=2,
         native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
@@ -97,12 +104,12 @@ SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     CONF_COST_KEY: WallboxSensorEntityDescription(
         key=CONF_COST_KEY,
         icon="mdi:ev-station",
-        name="Cost",
+        name=SENSOR_NAMES[CONF_COST_KEY],
         state_class=SensorStateClass.TOTAL_INCREASING,
     ),
     CONF_STATE_OF_CHARGE_KEY: WallboxSensorEntityDescription(
         key=CONF_STATE_OF_CHARGE_KEY,
-        name="State of Charge",
+        name=SENSOR_NAMES[CONF_STATE_OF_CHARGE_KEY],
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
@@ -110,22 +117,22 @@ SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     CONF_CURRENT_MODE_KEY: WallboxSensorEntityDescription(
         key=CONF_CURRENT_MODE_KEY,
         icon="mdi:ev-station",
-        name="Current Mode",
+        name=SENSOR_NAMES[CONF_CURRENT_MODE_KEY],
     ),
     CONF_DEPOT_PRICE_KEY: WallboxSensorEntityDescription(
         key=CONF_DEPOT_PRICE_KEY,
         icon="mdi:ev-station",
-        name="Depot Price",
+        name=SENSOR_NAMES[CONF_DEPOT_PRICE_KEY],
         precision=2,
     ),
     CONF_STATUS_DESCRIPTION_KEY: WallboxSensorEntityDescription(
         key=CONF_STATUS_DESCRIPTION_KEY,
         icon="mdi:ev-station",
-        name="Status Description",
+        name=SENSOR_NAMES[CONF_STATUS_DESCRIPTION_KEY],
     ),
     CONF_MAX_CHARGING_CURRENT_KEY: WallboxSensorEntityDescription(
         key=CONF_MAX_CHARGING_CURRENT_KEY,
-        name="Max. Charging Current",
+        name=SENSOR_NAMES[CONF_MAX_CHARGING_CURRENT_KEY],
         native_unit_of_measurement=ELECTRIC_CURRENT_AMPERE,
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
@@ -165,12 +172,55 @@ class WallboxSensor(WallboxEntity, SensorEntity):
         self._attr_name = f"{entry.title} {description.name}"
         self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
+        policy = entry.options.get(CONF_SAMPLING, {}).get(description.key, {})
+        self._min_interval: float = policy.get(CONF_MIN_INTERVAL, 0)
+        self._deadband: float = policy.get(CONF_DEADBAND, 0)
+        self._heartbeat: float = policy.get(CONF_HEARTBEAT, 0)
+        self._attr_native_value = self._coordinator_value()
+        self._written_at = monotonic()
+        self._written_available = self.available
+
+    def _coordinator_value(self) -> StateType:
+        """Return the current value of the sensor in the coordinator data."""
         if (sensor_round := self.entity_description.precision) is not None:
             return cast(
                 StateType,
                 round(self.coordinator.data[self.entity_description.key], sensor_round),
             )
         return cast(StateType, self.coordinator.data[self.entity_description.key])
+
+    def _should_write(self, value: StateType, now: float) -> bool:
+        """Return whether the update policy lets a new value be written.
+
+        Availability changes are always written. The heartbeat only forces out
+        a change that min interval or deadband held back; an unchanged value
+        is never re-written, as the state machine would not record it anyway.
+        """
+        if self.available != self._written_available:
+            return True
+        if value == self._attr_native_value:
+            return False
+        elapsed = now - self._written_at
+        if self._heartbeat and elapsed >= self._heartbeat:
+            return True
+        if elapsed < self._min_interval:
+            return False
+        if (
+            self._deadband
+            and isinstance(value, (int, float))
+            and isinstance(self._attr_native_value, (int, float))
+        ):
+            return abs(value - self._attr_native_value) >= self._deadband
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state only when the sensor's update policy allows it."""
+        value = self._coordinator_value()
+        now = monotonic()
+        if not self._should_write(value, now):
+            return
+        self._attr_native_value = value
+        self._written_at = now
+        self._written_available = self.available
+        super()._handle_coordinator_update()
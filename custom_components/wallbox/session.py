@@ -0,0 +1,149 @@
+"""Charging session detection for the Wallbox integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    CONF_ADDED_ENERGY_KEY,
+    CONF_ADDED_RANGE_KEY,
+    CONF_CHARGING_POWER_KEY,
+    CONF_COST_KEY,
+    CONF_STATION,
+    CONF_STATUS_ID_KEY,
+    EVENT_SESSION_ENDED,
+    EVENT_SESSION_STARTED,
+)
+
+# Status ids from CHARGER_STATUS, grouped by what they say about the car.
+# Ids in none of these groups (errors, updating, unknown codes) neither start
+# nor end a session.
+# 165 and 209 are "Locked" with no car plugged in, so the charger is idle.
+# 210 is also "Locked", but with a car connected: locking mid-session holds
+# the session open as waiting rather than ending it.
+IDLE_STATUS_IDS = {0, 161, 162, 163, 165, 209}
+CHARGING_STATUS_IDS = {193, 194, 195, 196}
+PAUSED_STATUS_IDS = {178, 182}
+WAITING_STATUS_IDS = {164, 177, 179, 180, 181, 183, 184, 185, 186, 187, 188, 189, 210}
+ACTIVE_STATUS_IDS = CHARGING_STATUS_IDS | PAUSED_STATUS_IDS | WAITING_STATUS_IDS
+
+
+class WallboxSession:
+    """Running aggregates of one charging session, updated in O(1)."""
+
+    def __init__(self, started: datetime, complete: bool) -> None:
+        """Initialize."""
+        self.started = started
+        # False when the session was already running when tracking began.
+        self.complete = complete
+        self.charging_seconds = 0.0
+        self.paused_seconds = 0.0
+        self.waiting_seconds = 0.0
+        self.other_seconds = 0.0
+        self.peak_power = 0.0
+        self.power_seconds = 0.0
+        self.added_energy: float | None = None
+        self.added_range: float | None = None
+        self.cost: float | None = None
+
+    def add_interval(self, status_id: int | None, power: float, seconds: float) -> None:
+        """Attribute an interval to the status and power it was spent at."""
+        if status_id in CHARGING_STATUS_IDS:
+            self.charging_seconds += seconds
+        elif status_id in PAUSED_STATUS_IDS:
+            self.paused_seconds += seconds
+        elif status_id in WAITING_STATUS_IDS:
+            self.waiting_seconds += seconds
+        else:
+            self.other_seconds += seconds
+        self.power_seconds += power * seconds
+
+    def summary(self, ended: datetime) -> dict[str, Any]:
+        """Return the session summary."""
+        duration = (ended - self.started).total_seconds()
+        return {
+            "started": self.started.isoformat(),
+            "ended": ended.isoformat(),
+            "complete": self.complete,
+            "duration": duration,
+            "charging_time": self.charging_seconds,
+            "paused_time": self.paused_seconds,
+            "waiting_time": self.waiting_seconds,
+            "other_time": self.other_seconds,
+            "added_energy": self.added_energy,
+            "added_range": self.added_range,
+            "cost": self.cost,
+            "peak_charging_power": self.peak_power,
+            "average_charging_power": (
+                self.power_seconds / self.charging_seconds
+                if self.charging_seconds
+                else 0.0
+            ),
+        }
+
+
+class WallboxSessionTracker:
+    """Detect charging sessions from coordinator updates and fire events."""
+
+    def __init__(self, hass: HomeAssistant, station: str) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._station = station
+        self._session: WallboxSession | None = None
+        self._status_id: int | None = None
+        # Last status id that was idle or active, skipping errors and updates.
+        self._known_status_id: int | None = None
+        self._power = 0.0
+        self._updated: datetime | None = None
+
+    @callback
+    def async_handle_update(self, data: dict[str, Any] | None) -> None:
+        """Advance the session state machine with a new coordinator snapshot."""
+        if not data:
+            return
+        now = dt_util.utcnow()
+        status_id = data.get(CONF_STATUS_ID_KEY)
+        power = float(data.get(CONF_CHARGING_POWER_KEY) or 0)
+
+        if self._session is not None and self._updated is not None:
+            self._session.add_interval(
+                self._status_id,
+                self._power,
+                (now - self._updated).total_seconds(),
+            )
+
+        if self._session is None and status_id in ACTIVE_STATUS_IDS:
+            # Only a session seen leaving an idle status is complete. The first
+            # snapshot, or one after an error or update, may be mid-session,
+            # so no start event is fired for it.
+            self._session = WallboxSession(
+                now, complete=self._known_status_id in IDLE_STATUS_IDS
+            )
+            if self._session.complete:
+                self._hass.bus.async_fire(
+                    EVENT_SESSION_STARTED,
+                    {CONF_STATION: self._station, "started": now.isoformat()},
+                )
+        elif self._session is not None and status_id in IDLE_STATUS_IDS:
+            self._hass.bus.async_fire(
+                EVENT_SESSION_ENDED,
+                {CONF_STATION: self._station, **self._session.summary(now)},
+            )
+            self._session = None
+
+        if self._session is not None:
+            self._session.peak_power = max(self._session.peak_power, power)
+            # The cloud counters belong to the current session, so the latest
+            # value before the charger goes idle is the session total.
+            self._session.added_energy = data.get(CONF_ADDED_ENERGY_KEY)
+            self._session.added_range = data.get(CONF_ADDED_RANGE_KEY)
+            self._session.cost = data.get(CONF_COST_KEY)
+
+        if status_id in IDLE_STATUS_IDS | ACTIVE_STATUS_IDS:
+            self._known_status_id = status_id
+        self._status_id = status_id
+        self._power = power
+        self._updated = now
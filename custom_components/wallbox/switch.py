@@ -9,7 +9,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import WallboxCoordinator, WallboxEntity
 from .const import (
     CONF_DATA_KEY,
     CONF_PAUSE_RESUME_KEY,
@@ -17,6 +16,8 @@ from .const import (
     CONF_STATUS_DESCRIPTION_KEY,
     DOMAIN,
 )
+from .coordinator import WallboxCoordinator
+from .entity import WallboxEntity
 
 
 @dataclass
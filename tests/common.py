@@ -0,0 +1,193 @@
+"""Fake Wallbox cloud for the Wallbox integration tests."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+import copy
+from dataclasses import dataclass, field
+from http import HTTPStatus
+import threading
+import time
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+import requests
+
+from custom_components.wallbox.const import CONF_STATION, DOMAIN
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+# Latency of every fake API call, so overlapping calls actually overlap.
+CALL_LATENCY = 0.001
+
+# Longest a held call waits to be released, so a failing test cannot hang.
+HOLD_TIMEOUT = 5
+
+# Status ids a charger cycles through: ready, charging, paused, charging.
+STATUS_CYCLE = [161, 194, 182, 194]
+
+
+def _http_error(status: HTTPStatus) -> requests.exceptions.HTTPError:
+    """Return an HTTPError as raised by the wallbox client."""
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+
+@dataclass
+class FakeCallHold:
+    """Blocks the next call of a method until the test releases it."""
+
+    entered: threading.Event = field(default_factory=threading.Event)
+    released: threading.Event = field(default_factory=threading.Event)
+
+
+class FakeWallboxCloud:
+    """In-process stand-in for the Wallbox portal shared by all clients.
+
+    Clients are created with the station serial as username, so every call can
+    be attributed to a station and overlapping calls per station are counted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._lock = threading.Lock()
+        self.chargers: dict[str, dict[str, Any]] = {}
+        self.forbidden: set[str] = set()
+        self.calls: Counter[str] = Counter()
+        self.in_flight: Counter[str] = Counter()
+        self.max_in_flight: Counter[str] = Counter()
+        self._status_index: Counter[str] = Counter()
+        self._holds: dict[str, FakeCallHold] = {}
+
+    def add_charger(self, station: str) -> None:
+        """Register a charger with a status payload like the portal returns."""
+        self.chargers[station] = {
+            "name": f"Charger {station}",
+            "status_id": STATUS_CYCLE[0],
+            "charging_power": 0.0,
+            "max_available_power": 32,
+            "charging_speed": 0,
+            "added_range": 0,
+            "added_energy": 0.0,
+            "cost": 0.0,
+            "state_of_charge": None,
+            "current_mode": 1,
+            "depot_price": 0.4,
+            "config_data": {
+                "max_charging_current": 16,
+                "locked": 0,
+                "serial_number": station,
+                "part_number": "PLP1-0-2-4-9-002-E",
+                "software": {"currentVersion": "5.5.10"},
+            },
+        }
+
+    def advance(self, station: str) -> None:
+        """Move a charger to the next status of STATUS_CYCLE."""
+        self._status_index[station] += 1
+        status_id = STATUS_CYCLE[self._status_index[station] % len(STATUS_CYCLE)]
+        with self._lock:
+            charger = self.chargers[station]
+            charger["status_id"] = status_id
+            charger["charging_power"] = 7.4 if status_id == 194 else 0.0
+            charger["added_energy"] += charger["charging_power"] / 120
+
+    def hold(self, method: str) -> FakeCallHold:
+        """Block the next call of a client method until it is released."""
+        hold = self._holds[method] = FakeCallHold()
+        return hold
+
+    @contextmanager
+    def call(self, station: str, method: str) -> Iterator[None]:
+        """Track one API call for a station."""
+        with self._lock:
+            self.calls[method] += 1
+            self.in_flight[station] += 1
+            self.max_in_flight[station] = max(
+                self.max_in_flight[station], self.in_flight[station]
+            )
+            hold = self._holds.pop(method, None)
+        try:
+            if hold is not None:
+                hold.entered.set()
+                hold.released.wait(HOLD_TIMEOUT)
+            time.sleep(CALL_LATENCY)
+            yield
+        finally:
+            with self._lock:
+                self.in_flight[station] -= 1
+
+    def client(self, username: str, password: str) -> FakeWallbox:
+        """Return a client, with the same signature as wallbox.Wallbox."""
+        return FakeWallbox(self, username)
+
+
+class FakeWallbox:
+    """Fake of the wallbox.Wallbox client backed by a FakeWallboxCloud."""
+
+    def __init__(self, cloud: FakeWallboxCloud, station: str) -> None:
+        """Initialize."""
+        self._cloud = cloud
+        self._station = station
+
+    def authenticate(self) -> None:
+        """Authenticate, failing with 403 while the station is forbidden."""
+        with self._cloud.call(self._station, "authenticate"):
+            if self._station in self._cloud.forbidden:
+                raise _http_error(HTTPStatus.FORBIDDEN)
+
+    def getChargerStatus(self, station: str) -> dict[str, Any]:  # noqa: N802
+        """Return a copy of the charger status."""
+        with self._cloud.call(station, "getChargerStatus"):
+            return copy.deepcopy(self._cloud.chargers[station])
+
+    def setMaxChargingCurrent(self, station: str, current: float) -> None:  # noqa: N802
+        """Set the maximum charging current."""
+        with self._cloud.call(station, "setMaxChargingCurrent"):
+            config_data = self._cloud.chargers[station]["config_data"]
+            config_data["max_charging_current"] = current
+
+    def lockCharger(self, station: str) -> None:  # noqa: N802
+        """Lock the charger."""
+        with self._cloud.call(station, "lockCharger"):
+            self._cloud.chargers[station]["config_data"]["locked"] = 1
+
+    def unlockCharger(self, station: str) -> None:  # noqa: N802
+        """Unlock the charger."""
+        with self._cloud.call(station, "unlockCharger"):
+            self._cloud.chargers[station]["config_data"]["locked"] = 0
+
+    def pauseChargingSession(self, station: str) -> None:  # noqa: N802
+        """Pause charging."""
+        with self._cloud.call(station, "pauseChargingSession"):
+            self._cloud.chargers[station]["status_id"] = 182
+
+    def resumeChargingSession(self, station: str) -> None:  # noqa: N802
+        """Resume charging."""
+        with self._cloud.call(station, "resumeChargingSession"):
+            self._cloud.chargers[station]["status_id"] = 194
+
+
+def add_station_entry(
+    hass: HomeAssistant,
+    cloud: FakeWallboxCloud,
+    station: str,
+    options: dict[str, Any] | None = None,
+) -> MockConfigEntry:
+    """Register a charger in the fake cloud and add a config entry for it."""
+    cloud.add_charger(station)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Wallbox {station}",
+        unique_id=station,
+        data={
+            CONF_STATION: station,
+            CONF_USERNAME: station,
+            CONF_PASSWORD: "password",
+        },
+        options=options or {},
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,23 @@
+"""Fixtures for the Wallbox integration tests."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from .common import FakeWallboxCloud
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: Any) -> None:
+    """Load the integration from custom_components."""
+
+
+@pytest.fixture
+def fake_cloud() -> Iterator[FakeWallboxCloud]:
+    """Route every Wallbox client the integration creates to a fake cloud."""
+    cloud = FakeWallboxCloud()
+    with patch("custom_components.wallbox.coordinator.Wallbox", cloud.client):
+        yield cloud
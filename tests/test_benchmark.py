@@ -0,0 +1,117 @@
+"""Startup benchmarks for the Wallbox integration.
+
+Times importing the integration package in a fresh interpreter and setting up
+entries against the fake cloud. The numbers are logged and attached to the
+test report with record_property, so they can be compared between releases:
+
+    pytest -m benchmark --junitxml=benchmark.xml
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+from pathlib import Path
+from statistics import median
+import subprocess
+import sys
+from time import perf_counter
+
+import pytest
+
+from custom_components.wallbox.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from .common import FakeWallboxCloud, add_station_entry
+
+_LOGGER = logging.getLogger(__name__)
+
+ROOT = Path(__file__).parents[1]
+ROUNDS = 5
+STATIONS = 5
+
+# Home Assistant is already loaded when the integration is imported at
+# startup, so its modules are imported first and only our cost is timed.
+IMPORT_PROBE = """
+import json, sys
+import homeassistant.config_entries, homeassistant.const, homeassistant.core
+import homeassistant.exceptions, homeassistant.util.dt
+import custom_components.wallbox
+print(json.dumps([name for name in (
+    "wallbox", "custom_components.wallbox.coordinator"
+) if name in sys.modules]))
+"""
+
+
+def _import_time() -> tuple[int, list[str]]:
+    """Import the package in a fresh interpreter.
+
+    Return the cumulative import time in microseconds and the lazily loaded
+    modules that were imported anyway.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PROBE],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.count("|") != 2:
+            continue
+        _, cumulative, name = line.rsplit("|", 2)
+        if name.strip() == "custom_components.wallbox":
+            return int(cumulative), json.loads(result.stdout)
+    raise AssertionError("custom_components.wallbox was not imported")
+
+
+@pytest.mark.benchmark
+def test_import_time(record_property: Callable[[str, object], None]) -> None:
+    """Time importing the package and check the client is not loaded."""
+    rounds = [_import_time() for _ in range(ROUNDS)]
+
+    for _, loaded in rounds:
+        assert loaded == []
+    import_us = median(cumulative for cumulative, _ in rounds)
+    record_property("import_us", import_us)
+    _LOGGER.info("Importing custom_components.wallbox took %sus", import_us)
+
+
+@pytest.mark.benchmark
+async def test_setup_time(
+    hass: HomeAssistant,
+    fake_cloud: FakeWallboxCloud,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Time setting up entries against the fake cloud."""
+    entries = [
+        add_station_entry(hass, fake_cloud, f"{200000 + index}")
+        for index in range(STATIONS)
+    ]
+
+    durations = []
+    for entry in entries:
+        start = perf_counter()
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        durations.append(perf_counter() - start)
+    await hass.async_block_till_done()
+
+    record_property("setup_first_entry_s", durations[0])
+    record_property("setup_median_entry_s", median(durations))
+    for key in ("import", "first_refresh", "platforms", "setup"):
+        record_property(
+            f"setup_timings_{key}_median_s",
+            median(
+                hass.data[DOMAIN][entry.entry_id].setup_timings[key]
+                for entry in entries
+            ),
+        )
+    _LOGGER.info(
+        "Entry setup took %.3fs for the first entry, %.3fs median",
+        durations[0],
+        median(durations),
+    )
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,68 @@
+"""Test the Wallbox coordinator."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from unittest.mock import patch
+
+from custom_components.wallbox.const import CONF_LOCKED_UNLOCKED_KEY
+from custom_components.wallbox.coordinator import WallboxCoordinator
+from homeassistant.core import HomeAssistant
+
+from .common import HOLD_TIMEOUT, FakeWallboxCloud
+
+STATION = "300000"
+
+
+async def _async_until(condition: Callable[[], bool]) -> None:
+    """Run the event loop, including executor jobs, until the condition holds."""
+    for _ in range(HOLD_TIMEOUT * 1000):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not reached")
+
+
+async def test_refresh_after_command_joins_queued_fetch(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud
+) -> None:
+    """Test a poll queued behind a command is shared and reflects the command."""
+    fake_cloud.add_charger(STATION)
+    coordinator = WallboxCoordinator(
+        STATION, fake_cloud.client(STATION, "password"), hass
+    )
+    await coordinator.async_refresh()
+    assert coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == 0
+
+    with patch.object(
+        coordinator, "_async_update_data", wraps=coordinator._async_update_data
+    ) as update_data:
+        # The command holds the station lock while the cloud call is blocked.
+        lock_call = fake_cloud.hold("lockCharger")
+        command = hass.async_create_task(coordinator.async_set_lock_unlock(True))
+        assert await hass.async_add_executor_job(lock_call.entered.wait, HOLD_TIMEOUT)
+
+        # A scheduled poll arrives and queues its fetch behind the command.
+        poll = hass.async_create_task(coordinator.async_refresh())
+        await _async_until(lambda: update_data.call_count == 1)
+        fetch = coordinator._fetch_task  # pylint: disable=protected-access
+        assert fetch is not None and not fetch.done()
+        fetches = fake_cloud.calls["getChargerStatus"]
+
+        # The command completes; its refresh must join the queued fetch,
+        # which is held in the cloud until the join has happened.
+        status_call = fake_cloud.hold("getChargerStatus")
+        lock_call.released.set()
+        await _async_until(lambda: update_data.call_count == 2)
+        assert coordinator._fetch_task is fetch  # pylint: disable=protected-access
+        assert not fetch.done()
+
+        status_call.released.set()
+        await command
+        await poll
+
+    assert fake_cloud.calls["getChargerStatus"] == fetches + 1
+    assert fake_cloud.max_in_flight[STATION] == 1
+    assert coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == 1
+
+    await coordinator.async_shutdown()
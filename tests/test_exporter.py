@@ -0,0 +1,154 @@
+"""Test the Wallbox telemetry exporter."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.wallbox import exporter as exporter_module
+from custom_components.wallbox.exporter import (
+    EXPORT_BATCH_SIZE,
+    EXPORT_SOCKET_PREFIX,
+    WallboxExporter,
+)
+from homeassistant.core import HomeAssistant
+
+STATION = "300000"
+
+
+def _records(path: Path) -> list[dict]:
+    """Return the exported records without their timestamps."""
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    for record in records:
+        assert record.pop("ts") > 0
+    return records
+
+
+async def test_only_changed_fields_are_exported(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test each record holds the scalar fields that changed, None included."""
+    target = tmp_path / "export.ndjson"
+    exporter = WallboxExporter(hass, STATION, str(target))
+    exporter.async_start()
+
+    exporter.async_handle_update(
+        {"charging_power": 7.4, "state_of_charge": 50, "config_data": {"locked": 0}}
+    )
+    exporter.async_handle_update({"charging_power": 7.4, "state_of_charge": 50})
+    exporter.async_handle_update({"charging_power": 7.4, "state_of_charge": None})
+    exporter.async_handle_update({"charging_power": 0.0, "state_of_charge": None})
+    exporter.async_handle_update(None)
+    await exporter.async_stop()
+
+    assert _records(target) == [
+        {"station": STATION, "charging_power": 7.4, "state_of_charge": 50},
+        {"station": STATION, "state_of_charge": None},
+        {"station": STATION, "charging_power": 0.0},
+    ]
+
+
+async def test_records_are_written_in_batches(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test queued records are written at most EXPORT_BATCH_SIZE at a time."""
+    target = tmp_path / "export.ndjson"
+    exporter = WallboxExporter(hass, STATION, str(target))
+    for value in range(2 * EXPORT_BATCH_SIZE + 50):
+        exporter.async_handle_update({"added_energy": value})
+
+    with patch.object(
+        exporter, "_write_file", wraps=exporter._write_file
+    ) as write_file:
+        exporter.async_start()
+        await exporter.async_stop()
+
+    batches = [call.args[0].count("\n") for call in write_file.call_args_list]
+    assert batches == [EXPORT_BATCH_SIZE, EXPORT_BATCH_SIZE, 50]
+    assert [record["added_energy"] for record in _records(target)] == list(
+        range(2 * EXPORT_BATCH_SIZE + 50)
+    )
+
+
+async def test_full_queue_drops_records(
+    hass: HomeAssistant, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test records that do not fit in the queue are dropped and counted."""
+    monkeypatch.setattr(exporter_module, "EXPORT_QUEUE_SIZE", 3)
+    target = tmp_path / "export.ndjson"
+    exporter = WallboxExporter(hass, STATION, str(target))
+    for value in range(5):
+        exporter.async_handle_update({"added_energy": value})
+    assert exporter.dropped == 2
+
+    exporter.async_start()
+    await exporter.async_stop()
+
+    assert [record["added_energy"] for record in _records(target)] == [0, 1, 2]
+
+
+async def test_file_is_rotated(
+    hass: HomeAssistant, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the file is rotated at EXPORT_MAX_BYTES, keeping the backup count."""
+    monkeypatch.setattr(exporter_module, "EXPORT_MAX_BYTES", 100)
+    monkeypatch.setattr(exporter_module, "EXPORT_BACKUP_COUNT", 2)
+    target = tmp_path / "export.ndjson"
+    exporter = WallboxExporter(hass, STATION, str(target))
+    payload = "x" * 60 + "\n"
+
+    for _ in range(7):
+        await hass.async_add_executor_job(exporter._write_file, payload)
+
+    assert target.read_text() == payload
+    assert Path(f"{target}.1").read_text() == payload * 2
+    assert Path(f"{target}.2").read_text() == payload * 2
+    assert not Path(f"{target}.3").exists()
+
+
+async def test_stop_waits_for_write_in_flight(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test stopping mid-write never overlaps writes and loses no records."""
+    target = tmp_path / "export.ndjson"
+    exporter = WallboxExporter(hass, STATION, str(target))
+    write_file = exporter._write_file
+    entered = threading.Event()
+    lock = threading.Lock()
+    active = []
+    overlapped = []
+
+    def slow_write_file(payload: str) -> None:
+        with lock:
+            active.append(payload)
+            overlapped.append(len(active) > 1)
+        entered.set()
+        time.sleep(0.05)
+        write_file(payload)
+        with lock:
+            active.remove(payload)
+
+    with patch.object(exporter, "_write_file", slow_write_file):
+        exporter.async_start()
+        exporter.async_handle_update({"added_energy": 0})
+        assert await hass.async_add_executor_job(entered.wait, 5)
+        exporter.async_handle_update({"added_energy": 1})
+        await exporter.async_stop()
+
+    assert overlapped == [False, False]
+    assert [record["added_energy"] for record in _records(target)] == [0, 1]
+
+
+async def test_relative_targets_resolve_in_config_dir(hass: HomeAssistant) -> None:
+    """Test relative file and socket paths are resolved in the config directory."""
+    exporter = WallboxExporter(hass, STATION, "wallbox.ndjson")
+    assert exporter._target == hass.config.path("wallbox.ndjson")
+
+    exporter = WallboxExporter(hass, STATION, f"{EXPORT_SOCKET_PREFIX}wallbox.sock")
+    assert exporter._target == (
+        f"{EXPORT_SOCKET_PREFIX}{hass.config.path('wallbox.sock')}"
+    )
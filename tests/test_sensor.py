@@ -0,0 +1,156 @@
+"""Test the Wallbox sensor update policies."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.wallbox.const import (
+    CONF_CHARGING_POWER_KEY,
+    CONF_DEADBAND,
+    CONF_HEARTBEAT,
+    CONF_MIN_INTERVAL,
+    CONF_SAMPLING,
+    CONF_STATUS_DESCRIPTION_KEY,
+    DOMAIN,
+)
+from custom_components.wallbox.coordinator import WallboxCoordinator
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from .common import FakeWallboxCloud, add_station_entry
+
+STATION = "300000"
+CHARGING_POWER = f"sensor.wallbox_{STATION}_charging_power"
+STATUS_DESCRIPTION = f"sensor.wallbox_{STATION}_status_description"
+
+
+class Clock:
+    """Monotonic time for the sensors that only moves when the test says so."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.now = 1000.0
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Drive the sensor update policies from a manual clock."""
+    clock = Clock()
+    with patch("custom_components.wallbox.sensor.monotonic", lambda: clock.now):
+        yield clock
+
+
+async def _async_setup(
+    hass: HomeAssistant,
+    fake_cloud: FakeWallboxCloud,
+    key: str,
+    policy: dict[str, float],
+) -> WallboxCoordinator:
+    """Set up a station with an update policy for one sensor."""
+    entry = add_station_entry(hass, fake_cloud, STATION, {CONF_SAMPLING: {key: policy}})
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def _async_poll(
+    hass: HomeAssistant,
+    fake_cloud: FakeWallboxCloud,
+    coordinator: WallboxCoordinator,
+    clock: Clock,
+    seconds: float,
+    **charger: Any,
+) -> None:
+    """Change the charger after the given number of seconds and poll it."""
+    clock.now += seconds
+    fake_cloud.chargers[STATION].update(charger)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+
+async def test_min_interval(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud, clock: Clock
+) -> None:
+    """Test changes are held back until the minimum interval has passed."""
+    coordinator = await _async_setup(
+        hass, fake_cloud, CONF_CHARGING_POWER_KEY, {CONF_MIN_INTERVAL: 60}
+    )
+    assert hass.states.get(CHARGING_POWER).state == "0.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 10, charging_power=7.0)
+    assert hass.states.get(CHARGING_POWER).state == "0.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 50, charging_power=7.0)
+    assert hass.states.get(CHARGING_POWER).state == "7.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 30, charging_power=8.0)
+    assert hass.states.get(CHARGING_POWER).state == "7.0"
+
+
+async def test_deadband_against_last_written_value(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud, clock: Clock
+) -> None:
+    """Test small changes add up against the value last written, not polled."""
+    coordinator = await _async_setup(
+        hass, fake_cloud, CONF_CHARGING_POWER_KEY, {CONF_DEADBAND: 1}
+    )
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 30, charging_power=7.0)
+    assert hass.states.get(CHARGING_POWER).state == "7.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 30, charging_power=7.5)
+    assert hass.states.get(CHARGING_POWER).state == "7.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 30, charging_power=8.2)
+    assert hass.states.get(CHARGING_POWER).state == "8.2"
+
+
+async def test_heartbeat_overrides_min_interval(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud, clock: Clock
+) -> None:
+    """Test a held back change is written once the heartbeat is due."""
+    coordinator = await _async_setup(
+        hass,
+        fake_cloud,
+        CONF_CHARGING_POWER_KEY,
+        {CONF_MIN_INTERVAL: 600, CONF_DEADBAND: 10, CONF_HEARTBEAT: 120},
+    )
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 60, charging_power=7.0)
+    assert hass.states.get(CHARGING_POWER).state == "0.0"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 60, charging_power=7.0)
+    assert hass.states.get(CHARGING_POWER).state == "7.0"
+
+
+async def test_availability_is_always_written(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud, clock: Clock
+) -> None:
+    """Test the sensor goes unavailable and back regardless of its policy."""
+    coordinator = await _async_setup(
+        hass, fake_cloud, CONF_CHARGING_POWER_KEY, {CONF_MIN_INTERVAL: 600}
+    )
+
+    fake_cloud.forbidden.add(STATION)
+    await _async_poll(hass, fake_cloud, coordinator, clock, 1)
+    assert hass.states.get(CHARGING_POWER).state == STATE_UNAVAILABLE
+
+    fake_cloud.forbidden.discard(STATION)
+    await _async_poll(hass, fake_cloud, coordinator, clock, 1)
+    assert hass.states.get(CHARGING_POWER).state == "0.0"
+
+
+async def test_deadband_ignores_non_numeric_values(
+    hass: HomeAssistant, fake_cloud: FakeWallboxCloud, clock: Clock
+) -> None:
+    """Test a deadband does not hold back changes of text sensors."""
+    coordinator = await _async_setup(
+        hass, fake_cloud, CONF_STATUS_DESCRIPTION_KEY, {CONF_DEADBAND: 5}
+    )
+    assert hass.states.get(STATUS_DESCRIPTION).state == "Ready"
+
+    await _async_poll(hass, fake_cloud, coordinator, clock, 30, status_id=194)
+    assert hass.states.get(STATUS_DESCRIPTION).state == "Charging"
@@ -0,0 +1,199 @@
+"""Test the Wallbox charging session detection."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.wallbox.const import (
+    CONF_ADDED_ENERGY_KEY,
+    CONF_ADDED_RANGE_KEY,
+    CONF_CHARGING_POWER_KEY,
+    CONF_COST_KEY,
+    CONF_STATION,
+    CONF_STATUS_ID_KEY,
+    EVENT_SESSION_ENDED,
+    EVENT_SESSION_STARTED,
+)
+from custom_components.wallbox.session import WallboxSessionTracker
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+STATION = "300000"
+START = datetime(2022, 11, 1, 18, 0, tzinfo=dt_util.UTC)
+
+
+class Clock:
+    """Time source for the tracker that only moves when the test says so."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.now = START
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Drive the session tracker from a manual clock."""
+    clock = Clock()
+    with patch(
+        "custom_components.wallbox.session.dt_util.utcnow", lambda: clock.now
+    ):
+        yield clock
+
+
+def _snapshot(status_id: int, power: float = 0.0, energy: float = 0.0) -> dict:
+    """Return the coordinator data the tracker reads."""
+    return {
+        CONF_STATUS_ID_KEY: status_id,
+        CONF_CHARGING_POWER_KEY: power,
+        CONF_ADDED_ENERGY_KEY: energy,
+        CONF_ADDED_RANGE_KEY: round(energy * 6),
+        CONF_COST_KEY: round(energy * 0.4, 2),
+    }
+
+
+async def _async_feed(
+    hass: HomeAssistant,
+    clock: Clock,
+    tracker: WallboxSessionTracker,
+    updates: list[tuple[float, dict[str, Any]]],
+) -> None:
+    """Hand the tracker each snapshot after the given number of seconds."""
+    for seconds, data in updates:
+        clock.advance(seconds)
+        tracker.async_handle_update(data)
+    await hass.async_block_till_done()
+
+
+async def test_session_from_idle_to_idle(hass: HomeAssistant, clock: Clock) -> None:
+    """Test a session through charging and paused fires start and end events."""
+    started = async_capture_events(hass, EVENT_SESSION_STARTED)
+    ended = async_capture_events(hass, EVENT_SESSION_ENDED)
+    tracker = WallboxSessionTracker(hass, STATION)
+
+    await _async_feed(
+        hass,
+        clock,
+        tracker,
+        [
+            (0, _snapshot(161)),
+            (60, _snapshot(194, power=6.0)),
+            (300, _snapshot(194, power=9.0, energy=0.5)),
+            (300, _snapshot(182, energy=1.25)),
+        ],
+    )
+    assert [event.data for event in started] == [
+        {CONF_STATION: STATION, "started": (START + timedelta(seconds=60)).isoformat()}
+    ]
+    assert not ended
+
+    await _async_feed(hass, clock, tracker, [(300, _snapshot(161, energy=1.25))])
+    assert len(started) == 1
+    assert [event.data for event in ended] == [
+        {
+            CONF_STATION: STATION,
+            "started": (START + timedelta(seconds=60)).isoformat(),
+            "ended": (START + timedelta(seconds=960)).isoformat(),
+            "complete": True,
+            "duration": 900.0,
+            "charging_time": 600.0,
+            "paused_time": 300.0,
+            "waiting_time": 0.0,
+            "other_time": 0.0,
+            "added_energy": 1.25,
+            "added_range": 8,
+            "cost": 0.5,
+            "peak_charging_power": 9.0,
+            "average_charging_power": 7.5,
+        }
+    ]
+
+
+async def test_first_snapshot_mid_session(hass: HomeAssistant, clock: Clock) -> None:
+    """Test a session already running when tracking starts is incomplete."""
+    started = async_capture_events(hass, EVENT_SESSION_STARTED)
+    ended = async_capture_events(hass, EVENT_SESSION_ENDED)
+    tracker = WallboxSessionTracker(hass, STATION)
+
+    await _async_feed(
+        hass,
+        clock,
+        tracker,
+        [
+            (0, _snapshot(194, power=7.0, energy=3.0)),
+            (600, _snapshot(161, energy=3.0)),
+        ],
+    )
+
+    assert not started
+    assert len(ended) == 1
+    assert ended[0].data["complete"] is False
+    assert ended[0].data["started"] == START.isoformat()
+    assert ended[0].data["charging_time"] == 600.0
+    assert ended[0].data["added_energy"] == 3.0
+
+
+async def test_errors_and_updates_keep_session_open(
+    hass: HomeAssistant, clock: Clock
+) -> None:
+    """Test error, updating and locked statuses mid-session do not end it."""
+    started = async_capture_events(hass, EVENT_SESSION_STARTED)
+    ended = async_capture_events(hass, EVENT_SESSION_ENDED)
+    tracker = WallboxSessionTracker(hass, STATION)
+
+    await _async_feed(
+        hass,
+        clock,
+        tracker,
+        [
+            (0, _snapshot(161)),
+            (60, _snapshot(194, power=7.0)),
+            (120, _snapshot(14)),
+            (90, _snapshot(166)),
+            (30, _snapshot(194, power=7.0)),
+            (120, _snapshot(210)),
+            (60, _snapshot(194, power=7.0)),
+        ],
+    )
+    assert len(started) == 1
+    assert not ended
+
+    await _async_feed(hass, clock, tracker, [(120, _snapshot(163))])
+    assert len(started) == 1
+    assert len(ended) == 1
+    summary = ended[0].data
+    assert summary["complete"] is True
+    assert summary["duration"] == 540.0
+    assert summary["charging_time"] == 360.0
+    assert summary["waiting_time"] == 60.0
+    assert summary["other_time"] == 120.0
+    assert summary["average_charging_power"] == 7.0
+
+
+async def test_error_after_idle_starts_complete_session(
+    hass: HomeAssistant, clock: Clock
+) -> None:
+    """Test an error between idle and charging still counts as a clean start."""
+    started = async_capture_events(hass, EVENT_SESSION_STARTED)
+    tracker = WallboxSessionTracker(hass, STATION)
+
+    await _async_feed(
+        hass,
+        clock,
+        tracker,
+        [
+            (0, _snapshot(161)),
+            (30, _snapshot(14)),
+            (30, _snapshot(194, power=7.0)),
+        ],
+    )
+
+    assert len(started) == 1
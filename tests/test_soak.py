@@ -0,0 +1,238 @@
+"""Soak test for the Wallbox integration.
+
+Drives many stations through thousands of poll cycles, commands, auth
+failures and entry reloads against a fake cloud, and checks that memory,
+tasks, listeners and executor queue depth stay flat. Scale the run with
+WALLBOX_SOAK_CYCLES and WALLBOX_SOAK_STATIONS; set WALLBOX_SOAK_REPORT to a
+file path to keep the sampled trend as CSV; it is also logged at info level.
+Deselected by default, run it with pytest -m soak.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+from dataclasses import astuple, dataclass, fields
+import gc
+import json
+import logging
+import os
+from pathlib import Path
+import tracemalloc
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from custom_components.wallbox.const import (
+    CONF_EXPORT_TARGET,
+    DOMAIN,
+    EVENT_SESSION_ENDED,
+    EVENT_SESSION_STARTED,
+)
+from homeassistant.core import HomeAssistant
+
+from .common import FakeWallboxCloud, add_station_entry
+
+_LOGGER = logging.getLogger(__name__)
+
+SOAK_CYCLES = int(os.environ.get("WALLBOX_SOAK_CYCLES", "2000"))
+SOAK_STATIONS = int(os.environ.get("WALLBOX_SOAK_STATIONS", "5"))
+SOAK_REPORT = os.environ.get("WALLBOX_SOAK_REPORT")
+
+SAMPLE_EVERY = 100
+RELOAD_EVERY = 50
+AUTH_FAILURE_EVERY = 97
+MEMORY_GROWTH_LIMIT = 2 * 1024 * 1024
+
+
+@dataclass
+class SoakSample:
+    """Resource usage after a number of cycles."""
+
+    cycle: int
+    memory: int
+    tasks: int
+    bus_listeners: int
+    flows: int
+    executor_queue: int
+
+
+def _executor_queue_depth(hass: HomeAssistant) -> int:
+    """Return the number of executor jobs waiting for a worker thread."""
+    executor = getattr(hass.loop, "_default_executor", None)
+    if executor is None:
+        return 0
+    return executor._work_queue.qsize()  # pylint: disable=protected-access
+
+
+async def _async_sample(hass: HomeAssistant, cycle: int) -> SoakSample:
+    """Let pending work settle and sample resource usage."""
+    await hass.async_block_till_done()
+    gc.collect()
+    return SoakSample(
+        cycle=cycle,
+        memory=tracemalloc.get_traced_memory()[0],
+        tasks=len(asyncio.all_tasks()),
+        bus_listeners=sum(hass.bus.async_listeners().values()),
+        flows=len(hass.config_entries.flow.async_progress()),
+        executor_queue=_executor_queue_depth(hass),
+    )
+
+
+def _report(samples: list[SoakSample]) -> None:
+    """Log the sampled trend and write it as CSV if requested."""
+    names = [field.name for field in fields(SoakSample)]
+    _LOGGER.info(
+        "Soak trend:\n%s",
+        "\n".join(
+            " ".join(f"{value:>14}" for value in row)
+            for row in [names, *(astuple(sample) for sample in samples)]
+        ),
+    )
+    if SOAK_REPORT:
+        with Path(SOAK_REPORT).open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(names)
+            writer.writerows(astuple(sample) for sample in samples)
+
+
+async def _async_set_status(
+    hass: HomeAssistant,
+    cloud: FakeWallboxCloud,
+    entry: MockConfigEntry,
+    station: str,
+    status_id: int,
+) -> None:
+    """Move a charger to a status and poll it."""
+    cloud.chargers[station]["status_id"] = status_id
+    await hass.data[DOMAIN][entry.entry_id].async_refresh()
+
+
+@pytest.mark.soak
+async def test_soak(
+    hass: HomeAssistant,
+    fake_cloud: FakeWallboxCloud,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test long runs release memory, tasks, listeners and executor jobs."""
+    # Captured per-poll debug records would otherwise show up as a leak.
+    caplog.set_level(logging.WARNING, logger="custom_components.wallbox")
+    stations = [f"{100000 + index}" for index in range(SOAK_STATIONS)]
+    # Every other station also runs the telemetry exporter.
+    exports = {station: tmp_path / f"{station}.ndjson" for station in stations[::2]}
+    entries = [
+        add_station_entry(
+            hass,
+            fake_cloud,
+            station,
+            {CONF_EXPORT_TARGET: str(exports[station])} if station in exports else {},
+        )
+        for station in stations
+    ]
+
+    await hass.async_block_till_done()
+    baseline_tasks = len(asyncio.all_tasks())
+
+    for entry in entries:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    tracemalloc.start()
+    samples = [await _async_sample(hass, 0)]
+    max_executor_queue = 0
+
+    try:
+        for cycle in range(1, SOAK_CYCLES + 1):
+            station = stations[cycle % SOAK_STATIONS]
+            entry = entries[cycle % SOAK_STATIONS]
+            coordinator = hass.data[DOMAIN][entry.entry_id]
+            fake_cloud.advance(station)
+
+            # Polls of every station race a requested refresh and commands on
+            # one of them; the coordinator has to order them.
+            pending = [
+                asyncio.ensure_future(
+                    hass.data[DOMAIN][other.entry_id].async_refresh()
+                )
+                for other in entries
+            ]
+            pending.append(asyncio.ensure_future(coordinator.async_request_refresh()))
+            pending.append(
+                asyncio.ensure_future(coordinator.async_set_lock_unlock(cycle % 2 == 0))
+            )
+            pending.append(
+                asyncio.ensure_future(coordinator.async_pause_charger(cycle % 3 == 0))
+            )
+            # Let the calls get as far as the executor before sampling it.
+            for _ in range(3):
+                await asyncio.sleep(0)
+            max_executor_queue = max(max_executor_queue, _executor_queue_depth(hass))
+            await asyncio.gather(*pending)
+
+            if cycle % AUTH_FAILURE_EVERY == 0:
+                fake_cloud.forbidden.add(station)
+                await coordinator.async_refresh()
+                assert not coordinator.last_update_success
+                fake_cloud.forbidden.discard(station)
+                await coordinator.async_refresh()
+                assert coordinator.last_update_success
+
+            if cycle % RELOAD_EVERY == 0:
+                assert await hass.config_entries.async_reload(entry.entry_id)
+                await hass.async_block_till_done()
+                # pylint: disable=protected-access
+                assert not coordinator._listeners
+                assert coordinator._unsub_refresh is None
+                assert hass.data[DOMAIN][entry.entry_id] is not coordinator
+
+            if cycle % SAMPLE_EVERY == 0:
+                samples.append(await _async_sample(hass, cycle))
+    finally:
+        tracemalloc.stop()
+        _report(samples)
+
+    # The first sample after setup is the warm-up reference.
+    reference, *rest = samples[1:] or samples
+    for sample in rest:
+        assert sample.memory - reference.memory < MEMORY_GROWTH_LIMIT, sample
+        assert sample.tasks <= reference.tasks, sample
+        assert sample.bus_listeners <= reference.bus_listeners, sample
+        # At most one reauth flow per station, however many auth failures.
+        assert sample.flows <= SOAK_STATIONS, sample
+    assert max_executor_queue <= SOAK_STATIONS
+    # Each station never has more than one API call in flight.
+    assert set(fake_cloud.max_in_flight.values()) == {1}
+
+    # Sessions and exports still work on the entries after all the reloads.
+    for station, entry in zip(stations, entries):
+        await _async_set_status(hass, fake_cloud, entry, station, 161)
+    exported = {
+        station: path.stat().st_size if path.exists() else 0
+        for station, path in exports.items()
+    }
+    started = async_capture_events(hass, EVENT_SESSION_STARTED)
+    ended = async_capture_events(hass, EVENT_SESSION_ENDED)
+    for station, entry in zip(stations, entries):
+        await _async_set_status(hass, fake_cloud, entry, station, 194)
+        await _async_set_status(hass, fake_cloud, entry, station, 161)
+    await hass.async_block_till_done()
+    assert sorted(event.data["station"] for event in started) == stations
+    assert sorted(event.data["station"] for event in ended) == stations
+    assert all(event.data["complete"] for event in ended)
+
+    for flow in hass.config_entries.flow.async_progress():
+        hass.config_entries.flow.async_abort(flow["flow_id"])
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert not hass.data[DOMAIN]
+    assert len(asyncio.all_tasks()) <= baseline_tasks
+    for station, path in exports.items():
+        assert path.stat().st_size > exported[station]
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert {record["station"] for record in records} == {station}
+        assert [record["status_id"] for record in records[-2:]] == [194, 161]